@@ -1,5 +1,6 @@
 #!/usr/bin/python3
 
+import os
 import serial
 
 # Assumes the following settings for the DCS M9 RS-232 Interface
@@ -9,11 +10,16 @@ import serial
 class sorensenPower(object):
     DEFAULT_TIMEOUT = 0.125
 
+    # FTDI USB-serial adapters on Linux hold short replies for up to 16ms
+    FTDI_LATENCY_TIMER_PATH = "/sys/bus/usb-serial/devices/{}/latency_timer"
+    FTDI_LATENCY_TIMER_MS = 1
+
     # List of commands
     COMMAND_IDN                     = "*IDN?\r"
 
     COMMAND_MEASURE_CURRENT         = ":MEAS:CURR?\r"
     COMMAND_MEASURE_VOLTAGE         = ":MEAS:VOLT?\r"
+    COMMAND_MEASURE_VOLTAGE_CURRENT = ":MEAS:VOLT?;:MEAS:CURR?\r"
     COMMAND_SET_VOLTAGE             = ":SOUR:VOLT {:1.03f}\r"
     COMMAND_SET_VOLTAGE_RAMP        = ":SOUR:VOLT:RAMP {:1.03f} {:1.01f}\r"
     COMMAND_SET_CURRENT             = ":SOUR:CURR {:1.03f}\r"
@@ -48,10 +54,12 @@ class sorensenPower(object):
         result = None
 
         if (self.port.isOpen()):
+            commandBytes = command.encode()
+
             if (self.debug is True):
-                print(command.encode())
+                print(commandBytes)
 
-            self.port.write(command.encode())
+            self.port.write(commandBytes)
             result = self.port.readline().decode(encoding='UTF-8')
 
             if (self.debug is True):
@@ -59,11 +67,38 @@ class sorensenPower(object):
 
         return result
 
+    def _setLowLatency(self):
+        success = False
+
+        # Best effort, ASYNC_LOW_LATENCY is only available through pyserial on
+        # Linux and not every serial driver accepts it.
+        if (hasattr(self.port, 'set_low_latency_mode')):
+            try:
+                self.port.set_low_latency_mode(True)
+                success = True
+            except ValueError:
+                pass
+
+        # The sysfs entry only exists for FTDI ports on Linux and is usually
+        # only writable by root.
+        latencyTimerPath = self.FTDI_LATENCY_TIMER_PATH.format(os.path.basename(os.path.realpath(self.portName)))
+
+        try:
+            with open(latencyTimerPath, 'w') as latencyTimer:
+                latencyTimer.write(str(self.FTDI_LATENCY_TIMER_MS))
+
+            success = True
+        except OSError:
+            pass
+
+        return success
+
     def connect(self):
         success = False
 
         if (self.port.isOpen() == False):
             self.port.open()
+            self._setLowLatency()
 
         self.getStatus()
 
@@ -123,6 +158,25 @@ class sorensenPower(object):
 
         return current
 
+    def getMeasurements(self):
+        # Query voltage and current in a single round-trip. The replies come
+        # back either on one line separated by ';' or as one line each.
+        measurementsASCII = self._writeCommand(self.COMMAND_MEASURE_VOLTAGE_CURRENT).strip()
+
+        if (';' in measurementsASCII):
+            voltageASCII, currentASCII = measurementsASCII.split(';', 1)
+        else:
+            voltageASCII = measurementsASCII
+            currentASCII = self.port.readline().decode(encoding='UTF-8')
+
+            if (self.debug is True):
+                print("> " + currentASCII)
+
+        voltage = float(voltageASCII.strip())
+        current = float(currentASCII.strip())
+
+        return voltage, current
+
     def setOutputVoltage(self, voltage):
         success = False
 
@@ -15,8 +15,7 @@ power.setOutputVoltageRamp(4.0, 2.0)
 end = time.monotonic() + 100
 
 while (time.monotonic() < end):
-    voltage = power.getOutputVoltage()
-    current = power.getOutputCurrent()
+    voltage, current = power.getMeasurements()
     if abs(current) < 0.001:
         resistance = 1e10
     else: